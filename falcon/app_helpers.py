@@ -130,6 +130,8 @@ def default_serialize_error(req, resp, exception):
         else:
             representation = exception.to_xml()
 
+        # NOTE: Both serializers return UTF-8 encoded bytes, which are
+        #   passed through as-is when composing the response body.
         resp.body = representation
 
         # NOTE(kgriffs): No need to append the charset param, since
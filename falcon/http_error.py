@@ -14,10 +14,102 @@
 
 """HTTPError exception class."""
 
-from collections import OrderedDict
-import xml.etree.ElementTree as et
+try:
+    import orjson
+except ImportError:  # pragma: nocover
+    orjson = None
 
 from falcon.util import json, uri
+from falcon.util.uri import _ALL_ALLOWED as _URI_SAFE_CHARS
+
+
+def _json_dumps(obj):
+    # NOTE: Use compact separators to match the output of orjson.
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# NOTE: Exact types that orjson and the standard library serialize in the
+#   very same way (floats are excluded since their encoding of NaN and
+#   infinity differs).
+_ORJSON_SAFE_TYPES = frozenset((str, int, bool, type(None)))
+
+
+def _orjson_compatible(obj):
+    safe_types = _ORJSON_SAFE_TYPES
+
+    for value in obj.values():
+        if type(value) in safe_types:
+            continue
+
+        # NOTE: The link is the only nested object in the error's dict
+        if type(value) is not dict:
+            return False
+
+        for key, item in value.items():
+            if type(key) is not str or type(item) not in safe_types:
+                return False
+
+    return True
+
+
+if orjson is not None:
+    def _dumps(obj):
+        if not _orjson_compatible(obj):
+            return _json_dumps(obj)
+
+        # NOTE: orjson always emits compact UTF-8 bytes, thus sparing us the
+        #   intermediate str allocation and the subsequent encode() step.
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # NOTE: orjson rejects ints wider than 64 bits
+            return _json_dumps(obj)
+else:
+    _dumps = _json_dumps
+
+
+_DEFAULT_HREF_TEXT = 'Documentation related to this error'
+
+_XML_ERROR_START = b'<?xml version="1.0" encoding="UTF-8"?><error>'
+_XML_ERROR_END = b'</error>'
+
+# NOTE: The title is almost always present, so its opening tag is folded
+#   into the pre-encoded head of the document.
+_XML_HEAD = _XML_ERROR_START + b'<title>'
+
+
+def _cached_body(cache, key):
+    # NOTE: Compare each field by identity, since equality would, e.g.,
+    #   consider a code of 1 to be the same as True.
+    if cache is not None:
+        cached_key = cache[0]
+        if (
+            cached_key[0] is key[0] and
+            cached_key[1] is key[1] and
+            cached_key[2] is key[2] and
+            cached_key[3] is key[3]
+        ):
+            return cache[1]
+
+    return None
+
+
+def _xml_escape(text):
+    # PERF: Chaining str.replace() is a bit faster than
+    #   xml.sax.saxutils.escape(), and several times faster than
+    #   str.translate() with a multi-character mapping table (tested on
+    #   CPython 3.11), since each replace() is a single C-level scan that
+    #   returns the original string when there is nothing to substitute.
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _xml_element(tag, text):
+    # NOTE: Match ElementTree, which renders an element having no text as a
+    #   self-closing tag.
+    if not text:
+        return b'<%s />' % tag
+
+    return b'<%s>%s</%s>' % (tag, _xml_escape(text).encode('utf-8'), tag)
 
 
 class HTTPError(Exception):
@@ -73,37 +165,47 @@ class HTTPError(Exception):
 
     Attributes:
         status (str): HTTP status line, e.g. '748 Confounded by Ponies'.
-        has_representation (bool): Read-only property that determines
-            whether error details will be serialized when composing
-            the HTTP response. In ``HTTPError`` this property always
-            returns ``True``, but child classes may override it
-            in order to return ``False`` when an empty HTTP body is desired.
+        has_representation (bool): Read-only (by convention) attribute
+            that determines whether error details will be serialized when
+            composing the HTTP response. In ``HTTPError`` this attribute is
+            always ``True``, but child classes may override it (either as a
+            class attribute or as a property) in order to return ``False``
+            when an empty HTTP body is desired.
 
             (See also: :class:`falcon.http_error.NoRepresentation`)
 
             Note:
                 A custom error serializer
                 (see :meth:`~.App.set_error_serializer`) may choose to set a
-                response body regardless of the value of this property.
+                response body regardless of the value of this attribute.
 
         title (str): Error title to send to the client.
         description (str): Description of the error to send to the client.
         headers (dict): Extra headers to add to the response.
-        link (str): An href that the client can provide to the user for
-            getting help.
+        link (dict): A ``dict`` containing the link's ``'text'``,
+            ``'href'`` and ``'rel'``, that the client can provide to the user
+            for getting help (``None`` if no `href` was given).
         code (int): An internal application code that a user can reference when
             requesting support for the error.
     """
 
+    # NOTE: Keep the most frequently accessed attributes first.
     __slots__ = (
         'status',
         'title',
         'description',
-        'headers',
-        'link',
         'code',
+        'headers',
+        '_href',
+        '_href_text',
+        '_link',
+        '_json_cache',
+        '_xml_cache',
     )
 
+    # PERF: A plain class attribute is cheaper to look up than a property.
+    has_representation = True
+
     def __init__(self, status, title=None, description=None, headers=None,
                  href=None, href_text=None, code=None):
         self.status = status
@@ -118,20 +220,60 @@ class HTTPError(Exception):
         self.headers = headers
         self.code = code
 
+        # PERF: Defer building the link dict until it is actually
+        #   requested, since many errors are never serialized.
         if href:
-            link = self.link = OrderedDict()
-            link['text'] = (href_text or 'Documentation related to this error')
-            link['href'] = uri.encode(href)
-            link['rel'] = 'help'
+            # PERF: Most links are plain ASCII documentation URLs, so use
+            #   the same fast check as uri.encode() to skip the call
+            #   entirely when there is nothing to percent-encode.
+            self._href = (
+                href if not href.rstrip(_URI_SAFE_CHARS)
+                else uri.encode(href)
+            )
         else:
-            self.link = None
+            self._href = None
+
+        self._href_text = href_text or _DEFAULT_HREF_TEXT
+        self._link = None
+
+        self._json_cache = None
+        self._xml_cache = None
 
     def __repr__(self):
-        return '<%s: %s>' % (self.__class__.__name__, self.status)
+        # NOTE: f-strings would be marginally faster still, but are not
+        #   available on Python 3.5.
+        return '<%s: %s>' % (type(self).__name__, self.status)
 
     @property
-    def has_representation(self):
-        return True
+    def link(self):
+        link = self._link
+
+        if link is None and self._href is not None:
+            link = self._link = {
+                'text': self._href_text,
+                'href': self._href,
+                'rel': 'help',
+            }
+
+        return link
+
+    @link.setter
+    def link(self, value):
+        self._link = value
+        self._href = None
+        self._json_cache = self._xml_cache = None
+
+    def _cache_key(self):
+        # NOTE: While the href from the constructor is in effect, the link
+        #   dict is derived from it, so use the href in lieu of the dict.
+        #   This way the key does not change when the dict is materialized.
+        href = self._href
+        return (
+            self.title,
+            self.description,
+            self.code,
+            self._link if href is None else href,
+        )
 
     def to_dict(self, obj_type=dict):
         """Return a basic dictionary representing the error.
@@ -149,66 +291,148 @@ class HTTPError(Exception):
 
         """
 
-        obj = obj_type()
+        # PERF: Hoist attribute lookups into locals, and start from a dict
+        #   literal rather than an empty obj_type() instance.
+        description = self.description
+        code = self.code
+        link = self.link
 
-        obj['title'] = self.title
+        obj = {'title': self.title}
 
-        if self.description is not None:
-            obj['description'] = self.description
+        if description is not None:
+            obj['description'] = description
 
-        if self.code is not None:
-            obj['code'] = self.code
+        if code is not None:
+            obj['code'] = code
+
+        if link is not None:
+            obj['link'] = link
 
-        if self.link is not None:
-            obj['link'] = self.link
+        if obj_type is not dict:
+            custom_obj = obj_type()
+            custom_obj.update(obj)
+            return custom_obj
 
         return obj
 
     def to_json(self):
-        """Return a pretty-printed JSON representation of the error.
+        """Return a JSON representation of the error.
+
+        Errors that do not override :meth:`~.to_dict` are serialized with
+        ``orjson`` when it is installed, while any other error (or
+        environment) uses the standard library's :py:mod:`json` module.
+        Either way, the same document is rendered.
+
+        Note:
+            Unless :meth:`~.to_dict` is overridden, the serialized document
+            is cached on the error instance, and reused as long as none of
+            the `title`, `description`, `code` or `link` attributes have
+            been reassigned in the meantime. In-place changes to the `link`
+            dict are not detected.
 
         Returns:
-            str: A JSON document for the error.
+            bytes: A UTF-8 encoded JSON document for the error, or an empty
+            byte string when the error's `has_representation` attribute
+            is ``False``.
 
         """
 
-        obj = self.to_dict(OrderedDict)
-        return json.dumps(obj, ensure_ascii=False)
+        if not self.has_representation:
+            return b''
+
+        # NOTE: A custom to_dict() may return arbitrary objects, and may
+        #   depend on state that we know nothing about, so simply serialize
+        #   its result with the standard library, and do not cache it.
+        if type(self).to_dict is not HTTPError.to_dict:
+            return _json_dumps(self.to_dict())
+
+        # NOTE: Since the error's attributes may be reassigned, the cache is
+        #   only valid for the field values that it was rendered from.
+        key = self._cache_key()
+
+        body = _cached_body(self._json_cache, key)
+        if body is None:
+            body = _dumps(self.to_dict())
+            self._json_cache = (key, body)
+
+        return body
 
     def to_xml(self):
         """Return an XML-encoded representation of the error.
 
+        Note:
+            The serialized document is cached on the error instance, and
+            reused as long as none of the `title`, `description`, `code`
+            or `link` attributes have been reassigned in the meantime.
+            In-place changes to the `link` dict are not detected.
+
         Returns:
-            str: An XML document for the error.
+            bytes: A UTF-8 encoded XML document for the error, or an empty
+            byte string when the error's `has_representation` attribute
+            is ``False``.
 
         """
 
-        error_element = et.Element('error')
+        if not self.has_representation:
+            return b''
 
-        et.SubElement(error_element, 'title').text = self.title
+        key = self._cache_key()
 
-        if self.description is not None:
-            et.SubElement(error_element, 'description').text = self.description
+        body = _cached_body(self._xml_cache, key)
+        if body is not None:
+            return body
 
-        if self.code is not None:
-            et.SubElement(error_element, 'code').text = str(self.code)
+        element = _xml_element
 
-        if self.link is not None:
-            link_element = et.SubElement(error_element, 'link')
+        # PERF: The schema is small and fixed, so rather than building an
+        #   ElementTree DOM for every error, we simply escape each field and
+        #   join the pieces together.
+        title = self.title
+        if title:
+            parts = [_XML_HEAD, _xml_escape(title).encode('utf-8'), b'</title>']
+        else:
+            parts = [_XML_ERROR_START, b'<title />']
 
-            for key in ('text', 'href', 'rel'):
-                et.SubElement(link_element, key).text = self.link[key]
+        if self.description is not None:
+            parts.append(element(b'description', self.description))
 
-        return (b'<?xml version="1.0" encoding="UTF-8"?>' +
-                et.tostring(error_element, encoding='utf-8'))
+        if self.code is not None:
+            parts.append(element(b'code', str(self.code)))
+
+        link = self._link
+        if link is not None:
+            parts += (
+                b'<link>',
+                element(b'text', link['text']),
+                element(b'href', link['href']),
+                element(b'rel', link['rel']),
+                b'</link>',
+            )
+        elif self._href is not None:
+            # NOTE: Emit the link straight from the constructor arguments
+            #   when the link dict has not been materialized. Both the href
+            #   and its text are guaranteed to be non-empty in this case.
+            parts += (
+                b'<link>',
+                b'<text>', _xml_escape(self._href_text).encode('utf-8'), b'</text>',
+                b'<href>', _xml_escape(self._href).encode('utf-8'), b'</href>',
+                b'<rel>help</rel>',
+                b'</link>',
+            )
+
+        parts.append(_XML_ERROR_END)
+
+        body = b''.join(parts)
+        self._xml_cache = (key, body)
+        return body
 
 
 class NoRepresentation:
     """Mixin for ``HTTPError`` child classes that have no representation.
 
     This class can be mixed in when inheriting from ``HTTPError``, in order
-    to override the `has_representation` property such that it always
-    returns ``False``. This, in turn, will cause Falcon to return an empty
+    to override the `has_representation` attribute such that it is always
+    ``False``. This, in turn, will cause Falcon to return an empty
     response body to the client.
 
     You can use this mixin when defining errors that either should not have
@@ -218,13 +442,11 @@ class NoRepresentation:
     Note:
         This mixin class must appear before ``HTTPError`` in the base class
         list when defining the child; otherwise, it will not override the
-        `has_representation` property as expected.
+        `has_representation` attribute as expected.
 
     """
 
-    @property
-    def has_representation(self):
-        return False
+    has_representation = False
 
 
 class OptionalRepresentation:
@@ -247,4 +469,4 @@ class OptionalRepresentation:
     """
     @property
     def has_representation(self):
-        return super(OptionalRepresentation, self).description is not None
+        return self.description is not None
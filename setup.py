@@ -74,6 +74,11 @@ if CYTHON:
             ('*.pyx' if package in cython_package_names else '*.py'))
     ]
 
+    for ext_module in ext_modules:
+        # NOTE: Compile the framework with Python 3 semantics; otherwise,
+        #   Cython 0.x assumes language_level=2 for pure-Python modules.
+        ext_module.cython_directives = {'language_level': '3'}
+
     cmdclass = {'build_ext': build_ext}
 
 else:
@@ -213,7 +213,7 @@ class ClassResourceWithAwareHooks:
 def test_output_validator(client):
     result = client.simulate_get()
     assert result.status_code == 723
-    assert result.text == json.dumps({'title': 'Tricky'})
+    assert result.json == {'title': 'Tricky'}
 
 
 def test_serializer(client):
@@ -1,6 +1,7 @@
 import pytest
 
 import falcon
+import falcon.http_error
 
 try:
     import cython
@@ -11,5 +12,9 @@ except ImportError:
 class TestCythonized:
 
     @pytest.mark.skipif(not cython, reason='Cython not installed')
-    def test_imported_from_c_modules(self):
-        assert 'falcon/app.py' not in str(falcon.app)
+    @pytest.mark.parametrize('module,source', [
+        (falcon.app, 'falcon/app.py'),
+        (falcon.http_error, 'falcon/http_error.py'),
+    ])
+    def test_imported_from_c_modules(self, module, source):
+        assert source not in str(module)
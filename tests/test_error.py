@@ -178,3 +178,13 @@ def test_http_error_repr():
     error = falcon.HTTPBadRequest()
     _repr = '<%s: %s>' % (error.__class__.__name__, error.status)
     assert error.__repr__() == _repr
+
+
+@pytest.mark.parametrize('err, has_representation', [
+    (falcon.HTTPBadRequest(), True),
+    (falcon.HTTPRangeNotSatisfiable(1024), False),
+    (falcon.HTTPNotFound(), False),
+    (falcon.HTTPNotFound(description='Not here'), True),
+])
+def test_http_error_has_representation(err, has_representation):
+    assert err.has_representation is has_representation
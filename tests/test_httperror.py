@@ -1,6 +1,9 @@
 # -*- coding: utf-8
 
+import collections
 import datetime
+import enum
+import uuid
 import wsgiref.validate
 import xml.etree.ElementTree as et  # noqa: I202
 
@@ -12,6 +15,14 @@ import falcon.testing as testing
 from falcon.util import json
 
 
+class ErrorCode(enum.IntEnum):
+    SUPPORT = 1234
+
+
+class Toggle(enum.Enum):
+    ON = 'on'
+
+
 @pytest.fixture
 def client():
     app = falcon.App()
@@ -849,3 +860,229 @@ class TestHTTPError:
 
         assert response.status == headers['X-Error-Status']
         assert response.json['title'] == headers['X-Error-Status']
+
+    def test_to_json_returns_bytes(self):
+        error = falcon.HTTPError(
+            falcon.HTTP_792,
+            'Internet \xe7rashed!',
+            '\xc7atastrophic weather event',
+            href='http://example.com/api/climate',
+            code=8733224)
+
+        body = error.to_json()
+        assert isinstance(body, bytes)
+        assert json.loads(body.decode('utf-8')) == {
+            'title': 'Internet \xe7rashed!',
+            'description': '\xc7atastrophic weather event',
+            'code': 8733224,
+            'link': {
+                'text': 'Documentation related to this error',
+                'href': 'http://example.com/api/climate',
+                'rel': 'help',
+            },
+        }
+
+    def test_to_xml_escapes_special_characters(self):
+        error = falcon.HTTPError(
+            falcon.HTTP_400,
+            'Bad <input> & "stuff"',
+            'Expected a < b > c',
+            href='http://example.com/api?a=1&b=2',
+            href_text='Help & support')
+
+        body = error.to_xml()
+        assert isinstance(body, bytes)
+        assert body == (
+            b'<?xml version="1.0" encoding="UTF-8"?><error>'
+            b'<title>Bad &lt;input&gt; &amp; "stuff"</title>'
+            b'<description>Expected a &lt; b &gt; c</description>'
+            b'<link>'
+            b'<text>Help &amp; support</text>'
+            b'<href>http://example.com/api?a=1&amp;b=2</href>'
+            b'<rel>help</rel>'
+            b'</link>'
+            b'</error>'
+        )
+
+        root = et.fromstring(body)
+        assert root.find('title').text == 'Bad <input> & "stuff"'
+        assert root.find('link/href').text == 'http://example.com/api?a=1&b=2'
+
+    @pytest.mark.parametrize('href', [None, 'http://example.com/help'])
+    def test_serialized_representation_is_cached(self, href):
+        error = falcon.HTTPError(falcon.HTTP_400, 'Oops', 'Something broke', href=href)
+
+        assert error.to_json() is error.to_json()
+        assert error.to_xml() is error.to_xml()
+
+    def test_serialized_representation_code_identity(self):
+        error = falcon.HTTPError(falcon.HTTP_400, code=1)
+        assert b'"code":1' in error.to_json()
+        assert b'<code>1</code>' in error.to_xml()
+
+        error.code = True
+        assert b'"code":true' in error.to_json()
+        assert b'<code>True</code>' in error.to_xml()
+
+    def test_custom_to_dict_is_not_cached(self):
+        class CustomError(falcon.HTTPError):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.extra = 1
+
+            def to_dict(self, obj_type=dict):
+                obj = super().to_dict(obj_type)
+                obj['extra'] = self.extra
+                return obj
+
+        error = CustomError(falcon.HTTP_400)
+        assert json.loads(error.to_json().decode('utf-8'))['extra'] == 1
+
+        error.extra = 2
+        assert json.loads(error.to_json().decode('utf-8'))['extra'] == 2
+
+    @pytest.mark.parametrize('attr,value', [
+        ('title', 'Changed title'),
+        ('description', 'Changed description'),
+        ('code', 1337),
+    ])
+    def test_serialized_representation_reflects_changes(self, attr, value):
+        error = falcon.HTTPBadRequest()
+        error.to_json()
+        error.to_xml()
+
+        setattr(error, attr, value)
+
+        assert json.loads(error.to_json().decode('utf-8')) == error.to_dict()
+        assert et.fromstring(error.to_xml()).find(attr).text == str(value)
+
+    def test_to_dict_custom_obj_type(self):
+        error = falcon.HTTPError(
+            falcon.HTTP_400, 'Oops', code=42, href='http://example.com/help')
+
+        obj = error.to_dict(collections.OrderedDict)
+        assert isinstance(obj, collections.OrderedDict)
+        assert list(obj) == ['title', 'code', 'link']
+        assert obj == error.to_dict()
+
+    @pytest.mark.parametrize('href,expected', [
+        ('http://example.com/api/rbac', 'http://example.com/api/rbac'),
+        ('http://example.com/api/%C3%A7limate', 'http://example.com/api/%C3%A7limate'),
+        ('http://example.com/api/\xe7limate', 'http://example.com/api/%C3%A7limate'),
+        ('http://example.com/100%', 'http://example.com/100%25'),
+    ])
+    def test_link_href_encoding(self, href, expected):
+        error = falcon.HTTPError(falcon.HTTP_400, href=href)
+        assert error.link['href'] == expected
+
+    def test_link_override(self):
+        error = falcon.HTTPError(falcon.HTTP_400, href='http://example.com/api/rbac')
+        assert b'<href>http://example.com/api/rbac</href>' in error.to_xml()
+        assert b'"href":"http://example.com/api/rbac"' in error.to_json()
+
+        error.link = {
+            'text': 'Other docs',
+            'href': 'http://example.com/other',
+            'rel': 'help',
+        }
+
+        assert error.to_dict()['link']['href'] == 'http://example.com/other'
+        assert b'<href>http://example.com/other</href>' in error.to_xml()
+        assert b'"href":"http://example.com/other"' in error.to_json()
+
+        error.link = None
+
+        assert 'link' not in error.to_dict()
+        assert b'<link>' not in error.to_xml()
+        assert b'"link"' not in error.to_json()
+
+    @pytest.mark.parametrize('error', [
+        falcon.HTTPRangeNotSatisfiable(1024),
+        falcon.HTTPNotFound(),
+    ])
+    def test_no_representation_serializes_to_empty_body(self, error):
+        assert error.to_json() == b''
+        assert error.to_xml() == b''
+
+    def test_optional_representation_with_description(self):
+        error = falcon.HTTPNotFound(description='Not here')
+
+        assert json.loads(error.to_json().decode('utf-8')) == {
+            'title': '404 Not Found',
+            'description': 'Not here',
+        }
+        assert b'<description>Not here</description>' in error.to_xml()
+
+    def test_to_json_custom_to_dict(self):
+        class CustomError(falcon.HTTPError):
+            def to_dict(self, obj_type=dict):
+                return {1: 'one', 'big': 2 ** 70, 'title': self.title}
+
+        body = CustomError(falcon.HTTP_400).to_json()
+        assert body == b'{"1":"one","big":1180591620717411303424,"title":"400 Bad Request"}'
+
+    def test_to_json_custom_to_dict_unserializable(self):
+        class CustomError(falcon.HTTPError):
+            def to_dict(self, obj_type=dict):
+                return {'t': datetime.datetime(2020, 1, 1), 'title': self.title}
+
+        with pytest.raises(TypeError):
+            CustomError(falcon.HTTP_400).to_json()
+
+    @pytest.mark.parametrize('dumps', [
+        pytest.param(
+            falcon.http_error._dumps,
+            marks=pytest.mark.skipif(
+                falcon.http_error.orjson is None,
+                reason='orjson not installed'),
+            id='orjson',
+        ),
+        pytest.param(falcon.http_error._json_dumps, id='json'),
+    ])
+    def test_dumps(self, dumps):
+        assert dumps({'title': 'T', 'code': 2 ** 70}) == (
+            b'{"title":"T","code":1180591620717411303424}'
+        )
+        assert dumps({'title': 'T\xe7', 'code': 42}) == (
+            '{"title":"T\xe7","code":42}'.encode('utf-8')
+        )
+
+        for unsupported in (datetime.datetime(2020, 1, 1), uuid.uuid4(), object()):
+            with pytest.raises(TypeError):
+                dumps({'title': unsupported})
+            with pytest.raises(TypeError):
+                dumps({'title': 'T', 'link': {'text': unsupported}})
+
+    @pytest.mark.parametrize('code', [
+        None, 42, True, 2 ** 70, 1.5, float('nan'), ErrorCode.SUPPORT,
+    ])
+    def test_to_json_matches_stdlib(self, code):
+        error = falcon.HTTPError(falcon.HTTP_400, 'T', code=code, href='http://x/y')
+        assert error.to_json() == falcon.http_error._json_dumps(error.to_dict())
+
+    def test_to_json_unserializable_code(self):
+        error = falcon.HTTPError(falcon.HTTP_400, code=Toggle.ON)
+
+        with pytest.raises(TypeError):
+            error.to_json()
+
+    def test_to_xml_empty_elements(self):
+        error = falcon.HTTPError(falcon.HTTP_400, 'Oops', '')
+
+        assert error.to_xml() == (
+            b'<?xml version="1.0" encoding="UTF-8"?><error>'
+            b'<title>Oops</title>'
+            b'<description />'
+            b'</error>'
+        )
+
+        error.title = ''
+        error.link = {'text': '', 'href': None, 'rel': ''}
+
+        assert error.to_xml() == (
+            b'<?xml version="1.0" encoding="UTF-8"?><error>'
+            b'<title />'
+            b'<description />'
+            b'<link><text /><href /><rel /></link>'
+            b'</error>'
+        )